@@ -1,23 +1,33 @@
 #app.py
+import os
 from pathlib import Path
 
 from cli import ConsoleUI
 from service import TaskService
 from storage import JsonTaskStorage, StorageError
+from workload import RecordingTaskService
 
 DATA_FILE = Path("tasks.json")
+# если задана переменная окружения, все вызовы сервиса пишутся в трассу NDJSON
+TRACE_FILE = os.environ.get("TODO_TRACE")
 
 
 def main() -> int:
     try:
         storage = JsonTaskStorage(DATA_FILE)
         service = TaskService(storage)
-        ui = ConsoleUI(service)
-        ui.run()
+        if TRACE_FILE:
+            with open(TRACE_FILE, "a", encoding="utf-8") as trace:
+                ConsoleUI(RecordingTaskService(service, trace)).run()
+        else:
+            ConsoleUI(service).run()
         return 0
     except StorageError as e:
         print(f"⚠️  {e}")
         return 1
+    except OSError as e:
+        print(f"⚠️  Не удалось открыть файл трассы: {e}")
+        return 1
     except KeyboardInterrupt:
         print("\n👋 Завершено пользователем (Ctrl+C).")
         return 0
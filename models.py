@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
+from typing import Any, Mapping
 
 
 @dataclass
@@ -20,3 +21,13 @@ class Task:
             done=False,
             created_at=datetime.now().isoformat(timespec="seconds"),
         )
+
+    @staticmethod
+    def from_dict(item: Mapping[str, Any]) -> "Task":
+        """Собирает задачу из словаря (tasks.json, снимок трассы, импорт)."""
+        return Task(
+            id=int(item["id"]),
+            title=str(item["title"]),
+            done=bool(item.get("done", False)),
+            created_at=str(item.get("created_at", "")),
+        )
@@ -3,22 +3,33 @@ from __future__ import annotations
 
 import re
 from difflib import SequenceMatcher
-from typing import List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from models import Task
 from storage import JsonTaskStorage
 
 
+DUPLICATE_KEYS = ("title", "id")
+DUPLICATE_POLICIES = ("skip", "replace", "error")
+
+
 class TaskService:
     def __init__(self, storage: JsonTaskStorage):
         self.storage = storage
         self.tasks: List[Task] = self.storage.load()
+        # индекс по id: поиск за O(1) вместо прохода по списку
+        self._by_id: Dict[int, Task] = {t.id: t for t in self.tasks}
+        self._max_id = max(self._by_id, default=0)
 
     def _persist(self) -> None:
         self.storage.save(self.tasks)
 
     def _next_id(self) -> int:
-        return max((t.id for t in self.tasks), default=0) + 1
+        return self._max_id + 1
+
+    def _index(self, task: Task) -> None:
+        self._by_id[task.id] = task
+        self._max_id = max(self._max_id, task.id)
 
     def list_tasks(self, done: Optional[bool] = None) -> List[Task]:
         """
@@ -48,17 +59,107 @@ class TaskService:
             raise ValueError("Название задачи не может быть пустым.")
         task = Task.new(self._next_id(), title)
         self.tasks.append(task)
+        self._index(task)
         self._persist()
         return task
 
+    def import_tasks(
+        self,
+        records: Iterable[Task],
+        key: str = "title",
+        on_duplicate: str = "skip",
+    ) -> Tuple[int, int, int]:
+        """
+        Массовая вставка: записи читаются из итератора за один проход,
+        id назначаются последовательно, сохранение — один раз в конце.
+
+        key="title" -> дубликат определяется по названию, новым задачам выдаются новые id
+        key="id"    -> дубликат определяется по id, id из записи сохраняется;
+                       записи без id (id <= 0) получают новые id после прохода,
+                       когда все явные id уже заняты
+        on_duplicate: "skip" — пропустить, "replace" — перезаписать поля,
+                      "error" — прервать импорт без изменений (ValueError).
+
+        Возвращает (added, replaced, skipped).
+        """
+        if key not in DUPLICATE_KEYS:
+            raise ValueError(f"Неизвестный ключ дубликатов: {key}.")
+        if on_duplicate not in DUPLICATE_POLICIES:
+            raise ValueError(f"Неизвестная политика дубликатов: {on_duplicate}.")
+
+        by_id: Dict[int, Task] = dict(self._by_id)
+        by_key: Dict[object, Task] = (
+            by_id if key == "id" else {t.title: t for t in self.tasks}
+        )
+        next_id = self._next_id()
+        added: List[Task] = []
+        unnumbered: List[Task] = []
+        replacements: List[Tuple[Task, Task]] = []
+        skipped = 0
+
+        for record in records:
+            title = record.title.strip()
+            if not title:
+                raise ValueError("Название задачи не может быть пустым.")
+            lookup = record.id if key == "id" else title
+            existing = by_key.get(lookup) if (key != "id" or record.id > 0) else None
+
+            if existing is not None:
+                if on_duplicate == "error":
+                    raise ValueError(f"Дубликат задачи: {lookup}.")
+                if on_duplicate == "skip":
+                    skipped += 1
+                else:
+                    replacements.append((existing, record))
+                continue
+
+            task = Task(id=0, title=title, done=record.done, created_at=record.created_at)
+            added.append(task)
+            if key == "id" and record.id <= 0:
+                # явные id в приоритете: номер выдаётся после прохода
+                unnumbered.append(task)
+                continue
+
+            if key == "id":
+                task.id = record.id
+            else:
+                while next_id in by_id:
+                    next_id += 1
+                task.id = next_id
+            next_id = max(next_id, task.id + 1)
+            by_id[task.id] = task
+            by_key[task.id if key == "id" else title] = task
+
+        for task in unnumbered:
+            while next_id in by_id:
+                next_id += 1
+            task.id = next_id
+            by_id[task.id] = task
+
+        # изменения применяются только после успешного прохода по всем записям
+        for existing, record in replacements:
+            existing.title = record.title.strip()
+            existing.done = record.done
+            existing.created_at = record.created_at or existing.created_at
+        self.tasks.extend(added)
+        for task in added:
+            self._index(task)
+        if added or replacements:
+            self._persist()
+        return len(added), len(replacements), skipped
+
     def find(self, task_id: int) -> Optional[Task]:
-        return next((t for t in self.tasks if t.id == task_id), None)
+        return self._by_id.get(task_id)
 
     def delete_task(self, task_id: int) -> Task:
         task = self.find(task_id)
         if not task:
             raise KeyError(f"Задача с id={task_id} не найдена.")
         self.tasks = [t for t in self.tasks if t.id != task_id]
+        del self._by_id[task_id]
+        if task_id == self._max_id:
+            # id освобождается, как и раньше: следующий id = max + 1
+            self._max_id = max(self._by_id, default=0)
         self._persist()
         return task
 
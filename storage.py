@@ -4,18 +4,22 @@ from __future__ import annotations
 import json
 from dataclasses import asdict
 from pathlib import Path
-from typing import List
+from typing import Iterator, List, Optional
 
 from models import Task
 
+# размер блока при потоковом чтении tasks.json
+READ_CHUNK_SIZE = 64 * 1024
+
 
 class StorageError(Exception):
     pass
 
 
 class JsonTaskStorage:
-    def __init__(self, file_path: Path):
+    def __init__(self, file_path: Path, tmp_suffix: str = ".tmp"):
         self.file_path = file_path
+        self.tmp_suffix = tmp_suffix
 
     def load(self) -> List[Task]:
         if not self.file_path.exists():
@@ -38,18 +42,9 @@ class JsonTaskStorage:
 
             tasks: List[Task] = []
             for item in data:
-                if not isinstance(item, dict):
-                    continue
-                if "id" not in item or "title" not in item:
-                    continue
-                tasks.append(
-                    Task(
-                        id=int(item["id"]),
-                        title=str(item["title"]),
-                        done=bool(item.get("done", False)),
-                        created_at=str(item.get("created_at", "")),
-                    )
-                )
+                task = self._task_from_item(item)
+                if task is not None:
+                    tasks.append(task)
             return tasks
 
         except json.JSONDecodeError as e:
@@ -59,11 +54,96 @@ class JsonTaskStorage:
         except (TypeError, ValueError) as e:
             raise StorageError("Некорректные данные в tasks.json.") from e
 
+    def iter_tasks(self) -> Iterator[Task]:
+        """
+        Читает tasks.json по одной задаче, не загружая файл целиком:
+        в памяти держится только текущий блок и текущий элемент списка.
+        Отсутствующий или пустой файл — пустой список; всё, кроме пробелов,
+        после закрывающей ']' считается повреждением файла.
+        """
+        if not self.file_path.exists():
+            return
+
+        decoder = json.JSONDecoder()
+        try:
+            with self.file_path.open(encoding="utf-8") as f:
+                buf, pos, eof = "", 0, False
+                # start -> '[' ; first -> элемент или ']' ; item -> элемент ; sep -> ',' или ']' ;
+                # end -> только пробелы до конца файла
+                state = "start"
+                while True:
+                    while pos < len(buf) and buf[pos].isspace():
+                        pos += 1
+                    if pos == len(buf):
+                        if eof:
+                            break
+                        chunk = f.read(READ_CHUNK_SIZE)
+                        buf, pos, eof = buf[pos:] + chunk, 0, not chunk
+                        continue
+
+                    ch = buf[pos]
+                    if state == "start":
+                        if ch != "[":
+                            raise StorageError("Некорректный формат tasks.json: ожидался список.")
+                        pos += 1
+                        state = "first"
+                    elif state == "end":
+                        raise json.JSONDecodeError("Лишние данные после конца списка", buf, pos)
+                    elif state == "sep":
+                        if ch == "]":
+                            state = "end"
+                        elif ch == ",":
+                            state = "item"
+                        else:
+                            raise json.JSONDecodeError("Ожидалась ',' или ']'", buf, pos)
+                        pos += 1
+                    elif ch == "]" and state == "first":
+                        pos += 1
+                        state = "end"
+                    else:
+                        try:
+                            item, end = decoder.raw_decode(buf, pos)
+                            # число на границе блока может продолжаться в следующем
+                            complete = eof or end < len(buf)
+                        except json.JSONDecodeError:
+                            if eof:
+                                raise
+                            complete = False
+                        if not complete:
+                            # элемент не поместился в блок — дочитываем
+                            chunk = f.read(READ_CHUNK_SIZE)
+                            buf, pos, eof = buf[pos:] + chunk, 0, not chunk
+                            continue
+                        pos = end
+                        state = "sep"
+                        task = self._task_from_item(item)
+                        if task is not None:
+                            yield task
+
+                if state not in ("start", "end"):
+                    # файл оборвался внутри списка
+                    raise json.JSONDecodeError("Неожиданный конец файла", buf, pos)
+
+        except json.JSONDecodeError as e:
+            raise StorageError("tasks.json повреждён или содержит невалидный JSON.") from e
+        except OSError as e:
+            raise StorageError("Ошибка чтения tasks.json.") from e
+        except (TypeError, ValueError) as e:
+            raise StorageError("Некорректные данные в tasks.json.") from e
+
+    @staticmethod
+    def _task_from_item(item: object) -> Optional[Task]:
+        # элементы без id или title пропускаются, как и раньше
+        if not isinstance(item, dict):
+            return None
+        if "id" not in item or "title" not in item:
+            return None
+        return Task.from_dict(item)
 
     def save(self, tasks: List[Task]) -> None:
         try:
             data = [asdict(t) for t in tasks]
-            tmp = self.file_path.with_suffix(".tmp")
+            tmp = self.file_path.with_suffix(self.tmp_suffix)
             tmp.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
             tmp.replace(self.file_path)
         except OSError as e:
@@ -0,0 +1,146 @@
+import io
+import json
+import re
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+from cli import ConsoleUI
+from service import TaskService
+from storage import JsonTaskStorage
+from todo import TaskStorage, TodoApp
+
+# один и тот же сценарий для обеих точек входа:
+# добавить A, B, пустую задачу, выполнить A, удалить B, добавить C, выполнить несуществующую
+# todo.py работает с id, cli.py — с номером в текущем списке
+TODO_SESSION = ["1", "A", "1", "B", "1", "  ", "3", "1", "2", "2", "1", "C", "3", "99", "0"]
+CLI_SESSION = ["1", "A", "1", "B", "1", "  ", "3", "1", "2", "1", "1", "C", "3", "99", "0"]
+
+# сообщения, общие для обеих точек входа (различается только обрамление: id или нет)
+SHARED_MESSAGES = [
+    ("add", re.compile(r"^✅ (?:Задача добавлена: \[\d+\] |Добавлено: )(.+)$")),
+    ("delete", re.compile(r"^🗑️  (?:Задача удалена: \[\d+\] |Удалено: )(.+)$")),
+    ("done", re.compile(r"^🎉 (?:Готово! Задача выполнена: \[\d+\] |Выполнено: )(.+)$")),
+    ("empty_title", re.compile(r"^❌ Название задачи не может быть пустым\.()$")),
+    ("not_found", re.compile(r"^❌ (?:Задача с id=\d+ не найдена|Неверный номер)\.()$")),
+    ("exit", re.compile(r"^👋 До встречи!()$")),
+]
+
+
+def shared_events(output: str):
+    """Сводит вывод сессии к последовательности общих сообщений (событие, название)."""
+    events = []
+    for line in output.splitlines():
+        for event, pattern in SHARED_MESSAGES:
+            match = pattern.match(line)
+            if match:
+                events.append((event, match.group(1)))
+                break
+    return events
+
+
+class CountingList(list):
+    """Список задач, считающий полные проходы по себе."""
+
+    iterations = 0
+
+    def __iter__(self):
+        self.iterations += 1
+        return super().__iter__()
+
+
+class TestTodoParity(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = TemporaryDirectory()
+        self.root = Path(self.tmp_dir.name)
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def _run(self, storage, make_app, session):
+        out = io.StringIO()
+        with patch.object(storage, "save", wraps=storage.save) as save, \
+                patch("builtins.input", side_effect=session), redirect_stdout(out):
+            make_app(storage).run()
+        state = [
+            (item["id"], item["title"], item["done"])
+            for item in json.loads(storage.file_path.read_text(encoding="utf-8"))
+        ]
+        return state, save.call_count, out.getvalue()
+
+    def test_same_session_gives_same_state_and_saves(self):
+        todo_state, todo_saves, todo_out = self._run(
+            TaskStorage(self.root / "todo.json"), TodoApp, TODO_SESSION
+        )
+        cli_state, cli_saves, cli_out = self._run(
+            JsonTaskStorage(self.root / "cli.json"), lambda s: ConsoleUI(TaskService(s)), CLI_SESSION
+        )
+
+        self.assertEqual(todo_state, [(1, "A", True), (2, "C", False)])
+        self.assertEqual(todo_state, cli_state)
+        # по одному сохранению на каждое успешное изменение
+        self.assertEqual(todo_saves, 5)
+        self.assertEqual(todo_saves, cli_saves)
+        self.assertEqual(
+            shared_events(todo_out),
+            [
+                ("add", "A"), ("add", "B"), ("empty_title", ""), ("done", "A"),
+                ("delete", "B"), ("add", "C"), ("not_found", ""), ("exit", ""),
+            ],
+        )
+        self.assertEqual(shared_events(todo_out), shared_events(cli_out))
+
+    def test_lookups_do_not_scan_task_list(self):
+        todo_app = TodoApp(TaskStorage(self.root / "todo.json"))
+        cli_service = TaskService(JsonTaskStorage(self.root / "cli.json"))
+        entry_points = {
+            "todo": (todo_app.service, todo_app.find_task),
+            "cli": (cli_service, cli_service.find),
+        }
+        for name, (service, find) in entry_points.items():
+            with self.subTest(entry_point=name):
+                for i in range(100):
+                    service.add_task(f"Задача {i}")
+                service.tasks = CountingList(service.tasks)
+
+                for task_id in (1, 50, 100, 101):
+                    find(task_id)
+                service._next_id()
+                self.assertEqual(service.tasks.iterations, 0)
+
+    def test_todo_app_runs_on_shared_service(self):
+        app = TodoApp(TaskStorage(self.root / "tasks.json"))
+        self.assertIsInstance(app.service, TaskService)
+        with redirect_stdout(io.StringIO()):
+            app.add_task("A")
+        self.assertIs(app.find_task(1), app.service.find(1))
+
+    def test_todo_storage_uses_json_tmp_file(self):
+        storage = TaskStorage(self.root / "tasks.json")
+        with patch.object(Path, "replace", autospec=True) as replace:
+            storage.save([])
+        self.assertEqual(replace.call_args.args[0].name, "tasks.json.tmp")
+
+    def test_todo_does_not_create_missing_file_on_load(self):
+        data_file = self.root / "tasks.json"
+        app = TodoApp(TaskStorage(data_file))
+        self.assertEqual(app.tasks, [])
+        self.assertFalse(data_file.exists())
+
+    def test_todo_ignores_corrupted_file(self):
+        data_file = self.root / "tasks.json"
+        data_file.write_text("{not json", encoding="utf-8")
+
+        out = io.StringIO()
+        with redirect_stdout(out):
+            app = TodoApp(TaskStorage(data_file))
+            app.add_task("Новая")
+
+        self.assertIn("Файл будет проигнорирован", out.getvalue())
+        self.assertEqual([t.title for t in app.tasks], ["Новая"])
+
+
+if __name__ == "__main__":
+    unittest.main()
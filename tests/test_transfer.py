@@ -0,0 +1,157 @@
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+from service import TaskService
+from storage import JsonTaskStorage, StorageError
+from transfer import export_tasks, import_tasks, iter_records
+
+
+class TestTransfer(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = TemporaryDirectory()
+        self.root = Path(self.tmp_dir.name)
+        self.source = TaskService(JsonTaskStorage(self.root / "source.json"))
+        self.target = TaskService(JsonTaskStorage(self.root / "target.json"))
+
+        self.source.add_task("Купить молоко")
+        self.source.add_task("Помыть посуду, срочно")
+        self.source.mark_done(1)
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def test_roundtrip_preserves_tasks_in_both_formats(self):
+        for name in ("tasks.ndjson", "tasks.csv"):
+            with self.subTest(name=name):
+                path = self.root / name
+                stats = export_tasks(self.source.storage, path)
+                self.assertEqual(stats.records, 2)
+
+                records = list(iter_records(path))
+                self.assertEqual(
+                    [(t.id, t.title, t.done, t.created_at) for t in records],
+                    [(t.id, t.title, t.done, t.created_at) for t in self.source.tasks],
+                )
+
+    def test_import_assigns_ids_and_persists_once(self):
+        self.target.add_task("Уже есть")
+        path = self.root / "tasks.ndjson"
+        export_tasks(self.source.storage, path)
+
+        with patch.object(self.target.storage, "save", wraps=self.target.storage.save) as save:
+            stats = import_tasks(self.target, path)
+
+        self.assertEqual(save.call_count, 1)
+        self.assertEqual(stats.added, 2)
+        self.assertEqual([t.id for t in self.target.tasks], [1, 2, 3])
+        self.assertTrue(self.target.find(2).done)
+
+    def test_duplicates_by_title_are_skipped_or_replaced(self):
+        path = self.root / "tasks.csv"
+        export_tasks(self.source.storage, path)
+        self.target.add_task("Купить молоко")
+
+        stats = import_tasks(self.target, path, key="title", on_duplicate="skip")
+        self.assertEqual((stats.added, stats.replaced, stats.skipped), (1, 0, 1))
+        self.assertFalse(self.target.find(1).done)
+
+        stats = import_tasks(self.target, path, key="title", on_duplicate="replace")
+        self.assertEqual((stats.added, stats.replaced, stats.skipped), (0, 2, 0))
+        self.assertTrue(self.target.find(1).done)
+        self.assertEqual(len(self.target.tasks), 2)
+
+    def test_duplicates_by_id_error_policy_leaves_store_unchanged(self):
+        path = self.root / "tasks.ndjson"
+        export_tasks(self.source.storage, path)
+        self.target.add_task("Другая задача")
+
+        with self.assertRaises(ValueError):
+            import_tasks(self.target, path, key="id", on_duplicate="error")
+        self.assertEqual([t.title for t in self.target.tasks], ["Другая задача"])
+
+        stats = import_tasks(self.target, path, key="id", on_duplicate="replace")
+        self.assertEqual((stats.added, stats.replaced), (1, 1))
+        self.assertEqual(self.target.find(1).title, "Купить молоко")
+        self.assertEqual(self.target.find(2).title, "Помыть посуду, срочно")
+
+    def test_explicit_ids_take_priority_over_auto_ids(self):
+        path = self.root / "tasks.ndjson"
+        path.write_text('{"title": "A"}\n{"id": 1, "title": "B"}\n', encoding="utf-8")
+
+        stats = import_tasks(self.target, path, key="id", on_duplicate="skip")
+
+        self.assertEqual((stats.added, stats.skipped), (2, 0))
+        self.assertEqual(self.target.find(1).title, "B")
+        self.assertEqual(self.target.find(2).title, "A")
+
+    def test_invalid_values_are_rejected(self):
+        cases = {
+            "short.csv": "id,title,done,created_at\n1\n",
+            "null.ndjson": '{"title": null}\n',
+            "number.ndjson": '{"title": 5}\n',
+            "float_id.ndjson": '{"id": 2.7, "title": "A"}\n',
+            "float_id.csv": "id,title\n2.7,A\n",
+            "negative_id.ndjson": '{"id": -1, "title": "A"}\n',
+        }
+        for name, content in cases.items():
+            with self.subTest(name=name):
+                path = self.root / name
+                path.write_text(content, encoding="utf-8")
+                with self.assertRaises(ValueError):
+                    import_tasks(self.target, path, key="id")
+        self.assertEqual(self.target.tasks, [])
+
+    def test_csv_with_bom_keeps_id_column(self):
+        path = self.root / "excel.csv"
+        path.write_text("id,title,done\n7,Из Excel,true\n", encoding="utf-8-sig")
+
+        import_tasks(self.target, path, key="id")
+
+        self.assertEqual(self.target.find(7).title, "Из Excel")
+        self.assertTrue(self.target.find(7).done)
+
+    def test_export_streams_store_without_loading_it(self):
+        path = self.root / "tasks.ndjson"
+        with patch.object(JsonTaskStorage, "load", side_effect=AssertionError("load вызван")):
+            stats = export_tasks(JsonTaskStorage(self.root / "source.json"), path)
+        self.assertEqual(stats.records, 2)
+
+    def test_store_is_read_item_by_item(self):
+        data_file = self.root / "source.json"
+        # блок меньше одной задачи: элементы собираются из нескольких чтений
+        with patch("storage.READ_CHUNK_SIZE", 5):
+            self.assertEqual(list(JsonTaskStorage(data_file).iter_tasks()), self.source.tasks)
+
+    def test_streaming_reader_rejects_corrupted_store(self):
+        cases = [
+            '[{"id": 1, "title": "a"}] garbage',
+            '[{"id": 1, "title": "a"}]]',
+            '[{"id": 1, "title": "a"}] {"x": 1}',
+            '[] []',
+            '[{"id": 1, "title": "a"}',
+            '[{"id": 1, "title": "a"},',
+            '[{"id": 1, "tit',
+        ]
+        data_file = self.root / "broken.json"
+        for content in cases:
+            with self.subTest(content=content):
+                data_file.write_text(content, encoding="utf-8")
+                with patch("storage.READ_CHUNK_SIZE", 4), self.assertRaises(StorageError):
+                    list(JsonTaskStorage(data_file).iter_tasks())
+                with self.assertRaises(StorageError):
+                    JsonTaskStorage(data_file).load()
+
+    def test_streaming_reader_accepts_trailing_whitespace(self):
+        data_file = self.root / "tasks.json"
+        data_file.write_text('[{"id": 1, "title": "a"}]\n  \n', encoding="utf-8")
+        self.assertEqual([t.title for t in JsonTaskStorage(data_file).iter_tasks()], ["a"])
+
+    def test_unknown_format_is_rejected(self):
+        with self.assertRaises(ValueError):
+            export_tasks(self.source.storage, self.root / "tasks.xml")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,173 @@
+import io
+import json
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from service import TaskService
+from storage import JsonTaskStorage
+from workload import RecordingTaskService, ReplayReport, replay_trace
+
+
+class TestWorkload(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = TemporaryDirectory()
+        self.root = Path(self.tmp_dir.name)
+        self.trace_file = self.root / "trace.ndjson"
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def _record_session(self) -> None:
+        service = TaskService(JsonTaskStorage(self.root / "recorded.json"))
+        with self.trace_file.open("w", encoding="utf-8") as trace:
+            recorder = RecordingTaskService(service, trace)
+            a = recorder.add_task("Купить молоко")
+            recorder.add_task("Помыть посуду")
+            recorder.mark_done(a.id)
+            recorder.list_tasks(done=False)
+            with self.assertRaises(KeyError):
+                recorder.delete_task(42)
+
+    def test_recorder_writes_one_line_per_call(self):
+        self._record_session()
+        snapshot, *records = [
+            json.loads(line) for line in self.trace_file.read_text(encoding="utf-8").splitlines()
+        ]
+
+        self.assertEqual(snapshot["type"], "snapshot")
+        self.assertEqual(snapshot["tasks"], [])
+        self.assertEqual({r["session"] for r in records}, {snapshot["session"]})
+        self.assertEqual(
+            [r["method"] for r in records],
+            ["add_task", "add_task", "mark_done", "list_tasks", "delete_task"],
+        )
+        self.assertEqual(records[0]["args"], ["Купить молоко"])
+        self.assertEqual(records[3]["kwargs"], {"done": False})
+        self.assertEqual(records[4]["error"], "KeyError")
+        self.assertTrue(all(r["latency_ms"] >= 0 for r in records))
+
+    def test_recorder_passes_through_other_attributes(self):
+        service = TaskService(JsonTaskStorage(self.root / "tasks.json"))
+        recorder = RecordingTaskService(service, io.StringIO())
+        self.assertIs(recorder.tasks, service.tasks)
+
+    def test_replay_reproduces_state_and_reports_stats(self):
+        self._record_session()
+        data_file = self.root / "replayed.json"
+
+        report = replay_trace(self.trace_file, JsonTaskStorage(data_file), speedup=0, concurrency=1)
+
+        self.assertEqual(report.operations, 5)
+        self.assertEqual(report.mismatches, 0)
+        self.assertEqual(report.saves, 3)
+        self.assertGreater(report.bytes_written, 0)
+        replayed = TaskService(JsonTaskStorage(data_file)).list_tasks()
+        self.assertEqual([(t.title, t.done) for t in replayed], [("Помыть посуду", False), ("Купить молоко", True)])
+
+    def test_replay_seeds_store_from_snapshot(self):
+        service = TaskService(JsonTaskStorage(self.root / "recorded.json"))
+        for title in ("1", "2", "3", "4", "5"):
+            service.add_task(title)
+        with self.trace_file.open("w", encoding="utf-8") as trace:
+            recorder = RecordingTaskService(service, trace)
+            recorder.mark_done(3)
+            recorder.toggle_done(4)
+            recorder.delete_task(2)
+            recorder.add_task("6")
+            recorder.update_title(1, "Первая")
+
+        report = replay_trace(self.trace_file, JsonTaskStorage(self.root / "replayed.json"), speedup=0)
+
+        self.assertEqual(report.mismatches, 0)
+        self.assertEqual(report.saves, 5)
+        replayed = TaskService(JsonTaskStorage(self.root / "replayed.json"))
+        self.assertEqual(
+            [(t.id, t.title, t.done) for t in replayed.tasks],
+            [(t.id, t.title, t.done) for t in service.tasks],
+        )
+
+    def test_concurrent_replay_keeps_session_order(self):
+        service = TaskService(JsonTaskStorage(self.root / "recorded.json"))
+        with self.trace_file.open("w", encoding="utf-8") as trace:
+            # четыре пересекающиеся по времени сессии: при проигрывании идут параллельно
+            recorders = [RecordingTaskService(service, trace) for _ in range(4)]
+            for i in range(50):
+                for recorder in recorders:
+                    task = recorder.add_task(f"Задача {i}")
+                    recorder.mark_done(task.id)
+                    recorder.delete_task(task.id)
+
+        report = replay_trace(
+            self.trace_file, JsonTaskStorage(self.root / "replayed.json"), speedup=0, concurrency=8
+        )
+
+        self.assertEqual(report.operations, 600)
+        self.assertEqual(report.mismatches, 0)
+        self.assertEqual(len(report.latencies_ms), 600)
+
+    def test_sequential_sessions_wait_for_earlier_ones(self):
+        service = TaskService(JsonTaskStorage(self.root / "recorded.json"))
+        with self.trace_file.open("a", encoding="utf-8") as trace:
+            first = RecordingTaskService(service, trace)
+            for i in range(300):
+                first.add_task(f"Задача {i}")
+        with self.trace_file.open("a", encoding="utf-8") as trace:
+            second = RecordingTaskService(service, trace)
+            for task_id in range(1, 301):
+                second.toggle_done(task_id)
+
+        data_file = self.root / "replayed.json"
+        report = replay_trace(self.trace_file, JsonTaskStorage(data_file), speedup=0, concurrency=4)
+
+        self.assertEqual(report.operations, 600)
+        self.assertEqual(report.mismatches, 0)
+        replayed = TaskService(JsonTaskStorage(data_file)).tasks
+        self.assertEqual([(t.id, t.done) for t in replayed], [(i, True) for i in range(1, 301)])
+
+    def test_replay_counts_unexpected_exceptions(self):
+        self.trace_file.write_text(
+            json.dumps({"method": "search_tasks", "args": [123], "kwargs": {}, "ts": 0, "error": None}) + "\n",
+            encoding="utf-8",
+        )
+
+        report = replay_trace(self.trace_file, JsonTaskStorage(self.root / "replayed.json"), speedup=0)
+
+        self.assertEqual(report.operations, 1)
+        self.assertEqual(report.mismatches, 1)
+        self.assertEqual(len(report.latencies_ms), 1)
+
+    def test_trace_write_failure_does_not_hide_result(self):
+        trace = io.StringIO()
+        service = TaskService(JsonTaskStorage(self.root / "tasks.json"))
+        recorder = RecordingTaskService(service, trace)
+        trace.close()
+
+        with redirect_stdout(io.StringIO()) as out:
+            task = recorder.add_task("Сохранится")
+            recorder.add_task("И эта тоже")
+
+        self.assertEqual(task.title, "Сохранится")
+        self.assertEqual(len(service.tasks), 2)
+        self.assertEqual(out.getvalue().count("Не удалось записать трассу"), 1)
+
+    def test_replay_rejects_invalid_options(self):
+        self._record_session()
+        with self.assertRaises(ValueError):
+            replay_trace(self.trace_file, JsonTaskStorage(self.root / "x.json"), speedup=-1)
+        with self.assertRaises(ValueError):
+            replay_trace(self.trace_file, JsonTaskStorage(self.root / "x.json"), concurrency=0)
+
+    def test_percentiles_use_nearest_rank(self):
+        report = ReplayReport(
+            operations=4, mismatches=0, duration_s=2.0,
+            latencies_ms=[4.0, 1.0, 3.0, 2.0], saves=0, bytes_written=0,
+        )
+        self.assertEqual(report.throughput, 2.0)
+        self.assertEqual(report.percentile(50), 2.0)
+        self.assertEqual(report.percentile(99), 4.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
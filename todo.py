@@ -1,122 +1,60 @@
 #todo.py
 from __future__ import annotations
 
-import json
-import sys
-from dataclasses import dataclass, asdict
-from datetime import datetime
 from pathlib import Path
 from typing import List, Optional
 
-
-DATA_FILE = Path("tasks.json")
+from models import Task
+from service import TaskService
+from storage import JsonTaskStorage, StorageError
 
 
-@dataclass
-class Task:
-    id: int
-    title: str
-    done: bool = False
-    created_at: str = ""
-
-    @staticmethod
-    def new(task_id: int, title: str) -> "Task":
-        return Task(
-            id=task_id,
-            title=title,
-            done=False,
-            created_at=datetime.now().isoformat(timespec="seconds"),
-        )
-
+DATA_FILE = Path("tasks.json")
 
-class StorageError(Exception):
-    pass
 
+class TaskStorage(JsonTaskStorage):
+    """
+    Хранилище упрощённой версии: то же JSON-хранилище, что и у app.py,
+    но ошибки не прерывают работу — повреждённый файл игнорируется,
+    а неудачное сохранение только выводит предупреждение.
+    """
 
-class TaskStorage:
     def __init__(self, file_path: Path):
-        self.file_path = file_path
+        super().__init__(file_path, tmp_suffix=".json.tmp")
 
     def load(self) -> List[Task]:
         if not self.file_path.exists():
+            # в отличие от app.py файл не создаётся до первого сохранения
             return []
-
         try:
-            raw = self.file_path.read_text(encoding="utf-8").strip()
-            if not raw:
-                return []
-            data = json.loads(raw)
-            if not isinstance(data, list):
-                raise StorageError("Некорректный формат файла: ожидался список задач.")
-
-            tasks: List[Task] = []
-            for item in data:
-                if not isinstance(item, dict):
-                    continue
-
-                if "id" not in item or "title" not in item:
-                    continue
-                tasks.append(
-                    Task(
-                        id=int(item["id"]),
-                        title=str(item["title"]),
-                        done=bool(item.get("done", False)),
-                        created_at=str(item.get("created_at", "")),
-                    )
-                )
-            return tasks
-        except json.JSONDecodeError as e:
-            raise StorageError(
-                "Не удалось прочитать tasks.json: файл повреждён или содержит невалидный JSON."
-            ) from e
-        except OSError as e:
-            raise StorageError("Ошибка чтения файла tasks.json.") from e
-        except ValueError as e:
-            raise StorageError("Некорректные данные в tasks.json.") from e
-
-    def save(self, tasks: List[Task]) -> None:
-        try:
-            data = [asdict(t) for t in tasks]
-            tmp = self.file_path.with_suffix(".json.tmp")
-            tmp.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
-            tmp.replace(self.file_path)
-        except OSError as e:
-            raise StorageError("Ошибка сохранения файла tasks.json.") from e
-
-
-class TodoApp:
-    def __init__(self, storage: TaskStorage):
-        self.storage = storage
-        self.tasks: List[Task] = []
-        self._load()
-
-    def _load(self) -> None:
-        try:
-            self.tasks = self.storage.load()
+            return super().load()
         except StorageError as e:
             print(f"⚠️  {e}")
             print("Файл будет проигнорирован, начнём с пустого списка задач.")
-            self.tasks = []
+            return []
 
-    def _persist(self) -> None:
+    def save(self, tasks: List[Task]) -> None:
         try:
-            self.storage.save(self.tasks)
+            super().save(tasks)
         except StorageError as e:
             print(f"⚠️  {e}")
             print("Изменения не сохранены.")
 
-    def _next_id(self) -> int:
-        return (max((t.id for t in self.tasks), default=0) + 1)
+
+class TodoApp:
+    def __init__(self, storage: TaskStorage):
+        self.service = TaskService(storage)
+
+    @property
+    def tasks(self) -> List[Task]:
+        return self.service.tasks
 
     def add_task(self, title: str) -> None:
-        title = title.strip()
-        if not title:
-            print("❌ Название задачи не может быть пустым.")
+        try:
+            task = self.service.add_task(title)
+        except ValueError as e:
+            print(f"❌ {e}")
             return
-
-        task = Task.new(self._next_id(), title)
-        self.tasks.append(task)
-        self._persist()
         print(f"✅ Задача добавлена: [{task.id}] {task.title}")
 
     def list_tasks(self) -> None:
@@ -132,10 +70,7 @@ class TodoApp:
         print()
 
     def find_task(self, task_id: int) -> Optional[Task]:
-        for t in self.tasks:
-            if t.id == task_id:
-                return t
-        return None
+        return self.service.find(task_id)
 
     def delete_task(self, task_id: int) -> None:
         task = self.find_task(task_id)
@@ -143,8 +78,7 @@ class TodoApp:
             print(f"❌ Задача с id={task_id} не найдена.")
             return
 
-        self.tasks = [t for t in self.tasks if t.id != task_id]
-        self._persist()
+        self.service.delete_task(task_id)
         print(f"🗑️  Задача удалена: [{task_id}] {task.title}")
 
     def mark_done(self, task_id: int) -> None:
@@ -156,8 +90,7 @@ class TodoApp:
             print(f"ℹ️  Задача уже отмечена как выполненная: [{task_id}] {task.title}")
             return
 
-        task.done = True
-        self._persist()
+        self.service.mark_done(task_id)
         print(f"🎉 Готово! Задача выполнена: [{task_id}] {task.title}")
 
     def menu(self) -> None:
@@ -0,0 +1,197 @@
+#transfer.py
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from models import Task
+from service import DUPLICATE_KEYS, DUPLICATE_POLICIES, TaskService
+from storage import JsonTaskStorage, StorageError
+
+FORMATS = ("ndjson", "csv")
+CSV_FIELDS = ["id", "title", "done", "created_at"]
+
+DATA_FILE = Path("tasks.json")
+
+
+@dataclass
+class TransferStats:
+    records: int
+    duration_s: float
+    added: int = 0
+    replaced: int = 0
+    skipped: int = 0
+
+    @property
+    def rate(self) -> float:
+        return self.records / self.duration_s if self.duration_s > 0 else 0.0
+
+
+def detect_format(path: Path, fmt: Optional[str] = None) -> str:
+    """Формат берётся из аргумента или из расширения файла."""
+    fmt = fmt or path.suffix.lstrip(".").lower()
+    if fmt == "jsonl":
+        fmt = "ndjson"
+    if fmt not in FORMATS:
+        raise ValueError(f"Неизвестный формат: {fmt!r} (ожидался ndjson или csv).")
+    return fmt
+
+
+def _parse_bool(value: object) -> bool:
+    if isinstance(value, bool):
+        return value
+    return str(value).strip().lower() in ("1", "true", "yes", "да")
+
+
+def _parse_id(value: object, where: str) -> int:
+    """Пустой id -> 0 (будет выдан новый); допускаются только целые неотрицательные."""
+    if value is None or value == "":
+        return 0
+    if isinstance(value, bool):
+        raise ValueError(f"{where}: некорректный id {value!r}.")
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    if isinstance(value, str):
+        raw = value.strip()
+        if raw.isascii() and raw.isdigit():
+            value = int(raw)
+    if not isinstance(value, int) or value < 0:
+        raise ValueError(f"{where}: некорректный id {value!r}.")
+    return value
+
+
+def _to_task(item: Dict[str, object], where: str) -> Task:
+    if not isinstance(item, dict):
+        raise ValueError(f"{where}: ожидалась запись с полем title.")
+    title = item.get("title")
+    if not isinstance(title, str):
+        # в том числе пропущенное поле и обрезанная строка CSV (None)
+        raise ValueError(f"{where}: ожидалось строковое поле title.")
+    return Task.from_dict({
+        "id": _parse_id(item.get("id"), where),
+        "title": title,
+        "done": _parse_bool(item.get("done") or False),
+        "created_at": item.get("created_at") or "",
+    })
+
+
+def iter_ndjson(path: Path) -> Iterator[Task]:
+    with path.open(encoding="utf-8-sig") as f:
+        for line_no, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                item = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Строка {line_no}: невалидный JSON.") from e
+            yield _to_task(item, f"Строка {line_no}")
+
+
+def iter_csv(path: Path) -> Iterator[Task]:
+    # utf-8-sig: CSV из Excel часто начинается с BOM, иначе теряется колонка id
+    with path.open(encoding="utf-8-sig", newline="") as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            yield _to_task(row, f"Строка {reader.line_num}")
+
+
+def iter_records(path: Path, fmt: Optional[str] = None) -> Iterator[Task]:
+    """Потоково читает задачи из файла, по одной записи за раз."""
+    if detect_format(path, fmt) == "csv":
+        return iter_csv(path)
+    return iter_ndjson(path)
+
+
+def write_records(tasks: Iterable[Task], path: Path, fmt: Optional[str] = None) -> int:
+    """Пишет задачи в файл по одной записи; возвращает число записей."""
+    fmt = detect_format(path, fmt)
+    count = 0
+    with path.open("w", encoding="utf-8", newline="") as f:
+        if fmt == "csv":
+            writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+            writer.writeheader()
+            for t in tasks:
+                row = asdict(t)
+                row["done"] = "true" if t.done else "false"
+                writer.writerow(row)
+                count += 1
+        else:
+            for t in tasks:
+                f.write(json.dumps(asdict(t), ensure_ascii=False) + "\n")
+                count += 1
+    return count
+
+
+def export_tasks(storage: JsonTaskStorage, path: Path, fmt: Optional[str] = None) -> TransferStats:
+    """Хранилище читается по одной задаче — список целиком в память не загружается."""
+    started = time.perf_counter()
+    count = write_records(storage.iter_tasks(), path, fmt)
+    return TransferStats(count, time.perf_counter() - started)
+
+
+def import_tasks(
+    service: TaskService,
+    path: Path,
+    fmt: Optional[str] = None,
+    key: str = "title",
+    on_duplicate: str = "skip",
+) -> TransferStats:
+    started = time.perf_counter()
+    added, replaced, skipped = service.import_tasks(
+        iter_records(path, fmt), key=key, on_duplicate=on_duplicate
+    )
+    return TransferStats(
+        records=added + replaced + skipped,
+        duration_s=time.perf_counter() - started,
+        added=added,
+        replaced=replaced,
+        skipped=skipped,
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Экспорт и импорт задач в NDJSON/CSV.")
+    parser.add_argument("--data-file", type=Path, default=DATA_FILE, help="файл хранилища")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    export_cmd = sub.add_parser("export", help="выгрузить задачи в файл")
+    export_cmd.add_argument("path", type=Path)
+    export_cmd.add_argument("--format", choices=FORMATS, default=None)
+
+    import_cmd = sub.add_parser("import", help="загрузить задачи из файла")
+    import_cmd.add_argument("path", type=Path)
+    import_cmd.add_argument("--format", choices=FORMATS, default=None)
+    import_cmd.add_argument("--key", choices=DUPLICATE_KEYS, default="title", help="поле для поиска дубликатов")
+    import_cmd.add_argument("--on-duplicate", choices=DUPLICATE_POLICIES, default="skip")
+
+    args = parser.parse_args(argv)
+
+    try:
+        storage = JsonTaskStorage(args.data_file)
+        if args.command == "export":
+            stats = export_tasks(storage, args.path, args.format)
+            print(f"📤 Выгружено записей: {stats.records} ({stats.rate:.0f} зап/с)")
+        else:
+            # для поиска дубликатов текущий список нужен целиком
+            stats = import_tasks(TaskService(storage), args.path, args.format, args.key, args.on_duplicate)
+            print(
+                f"📥 Обработано записей: {stats.records} ({stats.rate:.0f} зап/с): "
+                f"добавлено {stats.added}, заменено {stats.replaced}, пропущено {stats.skipped}"
+            )
+        return 0
+    except StorageError as e:
+        print(f"⚠️  {e}")
+        return 1
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}")
+        return 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,397 @@
+#workload.py
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import threading
+import time
+import uuid
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from itertools import chain
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any, Deque, Dict, Iterator, List, Optional, TextIO, Tuple
+
+from models import Task
+from service import TaskService
+from storage import JsonTaskStorage, StorageError
+
+# методы TaskService, вызовы которых пишутся в трассу
+RECORDED_METHODS = frozenset({
+    "add_task",
+    "delete_task",
+    "mark_done",
+    "set_done",
+    "update_title",
+    "toggle_done",
+    "list_tasks",
+    "find",
+    "search_tasks",
+})
+# методы, первым аргументом которых идёт id задачи
+ID_METHODS = frozenset({"delete_task", "mark_done", "set_done", "update_title", "toggle_done", "find"})
+
+
+class RecordingTaskService:
+    """
+    Обёртка над TaskService: каждый вызов пишется строкой NDJSON
+    (сессия, метод, аргументы, время вызова, задержка, ошибка).
+    Первой строкой сессии пишется снимок задач, чтобы проигрывание
+    начиналось с того же состояния хранилища.
+    Остальные атрибуты прозрачно берутся из исходного сервиса.
+    """
+
+    def __init__(self, service: TaskService, trace: TextIO):
+        self._service = service
+        self._trace: Optional[TextIO] = trace
+        self._lock = threading.Lock()
+        self.session = uuid.uuid4().hex
+        # снимок пишется сразу: ошибка здесь — ошибка открытия трассы
+        self._trace.write(json.dumps({
+            "type": "snapshot",
+            "session": self.session,
+            "ts": time.time(),
+            "tasks": [asdict(t) for t in service.tasks],
+        }, ensure_ascii=False) + "\n")
+        self._trace.flush()
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._service, name)
+        if name not in RECORDED_METHODS or not callable(attr):
+            return attr
+
+        def recorded(*args, **kwargs):
+            ts = time.time()
+            started = time.perf_counter()
+            try:
+                result = attr(*args, **kwargs)
+            except Exception as e:
+                self._record(ts, started, name, args, kwargs, type(e).__name__)
+                raise
+            self._record(ts, started, name, args, kwargs, None, getattr(result, "id", None))
+            return result
+
+        return recorded
+
+    def _record(
+        self,
+        ts: float,
+        started: float,
+        method: str,
+        args,
+        kwargs,
+        error: Optional[str],
+        result_id: Optional[int] = None,
+    ) -> None:
+        latency_ms = (time.perf_counter() - started) * 1000
+        record = {
+            "session": self.session,
+            "ts": ts,
+            "method": method,
+            "args": list(args),
+            "kwargs": kwargs,
+            "latency_ms": round(latency_ms, 3),
+            "error": error,
+        }
+        if method == "add_task" and result_id is not None:
+            # id новой задачи: при проигрывании он может оказаться другим
+            record["result_id"] = result_id
+        self._write(record)
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        """
+        Ошибка записи трассы не должна влиять на результат вызова:
+        выводим предупреждение и отключаем запись.
+        """
+        with self._lock:
+            if self._trace is None:
+                return
+            try:
+                self._trace.write(json.dumps(record, ensure_ascii=False) + "\n")
+                self._trace.flush()
+            except (OSError, TypeError, ValueError) as e:
+                self._trace = None
+                print(f"⚠️  Не удалось записать трассу ({e}), запись трассы отключена.")
+
+
+def iter_trace(trace_path: Path) -> Iterator[Dict[str, Any]]:
+    """Построчно читает трассу (снимки и вызовы), не загружая файл целиком."""
+    with trace_path.open(encoding="utf-8") as f:
+        for line_no, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Строка {line_no} трассы содержит невалидный JSON.") from e
+            if not isinstance(record, dict):
+                raise ValueError(f"Строка {line_no} трассы: ожидался объект.")
+            if record.get("type") == "snapshot":
+                if not isinstance(record.get("tasks"), list):
+                    raise ValueError(f"Строка {line_no} трассы: в снимке нет списка задач.")
+            elif record.get("method") not in RECORDED_METHODS:
+                raise ValueError(f"Строка {line_no} трассы: неизвестный метод {record.get('method')!r}.")
+            yield record
+
+
+def _snapshot_tasks(snapshot: Dict[str, Any]) -> List[Task]:
+    try:
+        return [Task.from_dict(item) for item in snapshot["tasks"]]
+    except (KeyError, TypeError, ValueError) as e:
+        raise ValueError("Некорректный снимок задач в трассе.") from e
+
+
+class CountingStorage:
+    """Обёртка над хранилищем: считает сохранения и записанные байты."""
+
+    def __init__(self, storage: JsonTaskStorage):
+        self.storage = storage
+        self.saves = 0
+        self.bytes_written = 0
+
+    def load(self):
+        return self.storage.load()
+
+    def save(self, tasks) -> None:
+        self.storage.save(tasks)
+        self.saves += 1
+        file_path = getattr(self.storage, "file_path", None)
+        if file_path is not None:
+            try:
+                self.bytes_written += file_path.stat().st_size
+            except OSError:
+                pass
+
+
+@dataclass
+class ReplayReport:
+    operations: int
+    mismatches: int
+    duration_s: float
+    latencies_ms: List[float]
+    saves: int
+    bytes_written: int
+
+    @property
+    def throughput(self) -> float:
+        return self.operations / self.duration_s if self.duration_s > 0 else 0.0
+
+    def percentile(self, p: float) -> float:
+        """Перцентиль задержки по методу ближайшего ранга."""
+        if not self.latencies_ms:
+            return 0.0
+        ordered = sorted(self.latencies_ms)
+        rank = max(1, math.ceil(len(ordered) * p / 100))
+        return ordered[rank - 1]
+
+    def format(self) -> str:
+        return (
+            f"Операций: {self.operations} (расхождений с трассой: {self.mismatches})\n"
+            f"Время: {self.duration_s:.3f} с, пропускная способность: {self.throughput:.1f} оп/с\n"
+            f"Задержка, мс: p50={self.percentile(50):.3f} "
+            f"p95={self.percentile(95):.3f} p99={self.percentile(99):.3f}\n"
+            f"Сохранений: {self.saves}, записано байт: {self.bytes_written}"
+        )
+
+
+class _SessionStream:
+    """Очередь вызовов одной сессии: выполняется строго по порядку одним потоком."""
+
+    def __init__(self, waits_for: List[Tuple["_SessionStream", int]]):
+        self.pending: Deque[Dict[str, Any]] = deque()
+        self.running = False
+        # id из трассы -> id, выданный при проигрывании
+        self.ids: Dict[int, int] = {}
+        # сессии, закончившиеся до начала этой: (сессия, сколько её вызовов дождаться)
+        self.waits_for = waits_for
+        self.last_ts = 0.0
+        self.enqueued = 0
+        self.completed = 0
+
+
+def replay_trace(
+    trace_path: Path,
+    storage: JsonTaskStorage,
+    speedup: float = 1.0,
+    concurrency: int = 1,
+) -> ReplayReport:
+    """
+    Проигрывает трассу против переданного хранилища.
+
+    Хранилище перезаписывается снимком из начала трассы (или пустым списком,
+    если снимка нет); снимки последующих сессий игнорируются — их состояние
+    воспроизводится самим проигрыванием.
+
+    speedup=1 — в исходном темпе, speedup=10 — в 10 раз быстрее,
+    speedup=0 — без пауз, как можно быстрее.
+    concurrency — число потоков-клиентов. Параллельно идут только сессии,
+    пересекавшиеся по времени записи: сессия стартует, когда выполнены все
+    вызовы сессий, закончившихся до её начала. Вызовы одной сессии идут
+    в исходном порядке; сами вызовы сервиса сериализуются, поэтому
+    задержка включает ожидание в очереди.
+
+    id задач, созданных в сессии, сопоставляются с id, выданными при
+    проигрывании: параллельные сессии могут получить другие номера.
+
+    Ошибкой считается только расхождение с трассой: вызов упал, хотя
+    в трассе завершился успешно, или наоборот (или упал с другой ошибкой).
+    """
+    if speedup < 0:
+        raise ValueError("speedup не может быть отрицательным.")
+    if concurrency < 1:
+        raise ValueError("concurrency должен быть не меньше 1.")
+
+    records = iter_trace(trace_path)
+    first = next(records, None)
+    if first is not None and first.get("type") == "snapshot":
+        storage.save(_snapshot_tasks(first))
+    else:
+        storage.save([])
+
+    counting = CountingStorage(storage)
+    service = TaskService(counting)
+    service_lock = threading.Lock()
+    latencies: List[float] = []
+    mismatches = 0
+    stats_lock = threading.Lock()
+    streams: Dict[Any, _SessionStream] = {}
+    streams_lock = threading.Condition()
+
+    def open_stream(session: Any, begin_ts: float) -> _SessionStream:
+        # вызывается под streams_lock, пока читается трасса
+        stream = streams.get(session)
+        if stream is None:
+            waits_for = [
+                (other, other.enqueued)
+                for other in streams.values()
+                if other.enqueued and other.last_ts < begin_ts
+            ]
+            stream = streams[session] = _SessionStream(waits_for)
+        return stream
+
+    def run(stream: _SessionStream, record: Dict[str, Any]) -> None:
+        nonlocal mismatches
+        started = time.perf_counter()
+        error: Optional[str] = None
+        try:
+            name = record["method"]
+            method = getattr(service, name)
+            args = list(record.get("args", []))
+            if name in ID_METHODS and args:
+                args[0] = stream.ids.get(args[0], args[0])
+            with service_lock:
+                result = method(*args, **record.get("kwargs", {}))
+            if record.get("result_id") is not None:
+                stream.ids[record["result_id"]] = result.id
+        except Exception as e:
+            error = type(e).__name__
+        latency_ms = (time.perf_counter() - started) * 1000
+        with stats_lock:
+            latencies.append(latency_ms)
+            if error != record.get("error"):
+                mismatches += 1
+
+    def drain(stream: _SessionStream) -> None:
+        with streams_lock:
+            # предшествующие сессии отправлены в пул раньше, поэтому ожидание не блокирует их
+            streams_lock.wait_for(
+                lambda: all(other.completed >= count for other, count in stream.waits_for)
+            )
+            stream.waits_for = []
+        while True:
+            with streams_lock:
+                if not stream.pending:
+                    stream.running = False
+                    return
+                record = stream.pending.popleft()
+            run(stream, record)
+            with streams_lock:
+                stream.completed += 1
+                streams_lock.notify_all()
+
+    calls = chain([first], records) if first is not None else records
+    operations = 0
+    first_ts: Optional[float] = None
+    futures: List[Future] = []
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for record in calls:
+            ts = float(record.get("ts", 0.0))
+            if record.get("type") == "snapshot":
+                with streams_lock:
+                    open_stream(record.get("session"), ts)
+                continue
+            if speedup > 0:
+                if first_ts is None:
+                    first_ts = ts
+                delay = (ts - first_ts) / speedup - (time.perf_counter() - started)
+                if delay > 0:
+                    time.sleep(delay)
+            operations += 1
+            with streams_lock:
+                stream = open_stream(record.get("session"), ts)
+                stream.pending.append(record)
+                stream.enqueued += 1
+                stream.last_ts = max(stream.last_ts, ts)
+                if stream.running:
+                    continue
+                stream.running = True
+            # завершённые задачи проверяем сразу, чтобы список не рос
+            pending: List[Future] = []
+            for future in futures:
+                if future.done():
+                    future.result()
+                else:
+                    pending.append(future)
+            futures = pending
+            futures.append(pool.submit(drain, stream))
+        for future in futures:
+            future.result()
+    duration = time.perf_counter() - started
+
+    return ReplayReport(
+        operations=operations,
+        mismatches=mismatches,
+        duration_s=duration,
+        latencies_ms=latencies,
+        saves=counting.saves,
+        bytes_written=counting.bytes_written,
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Проигрывание трассы нагрузки ToDo.")
+    parser.add_argument("trace", type=Path, help="файл трассы NDJSON")
+    parser.add_argument("--speedup", type=float, default=1.0, help="ускорение (0 — без пауз)")
+    parser.add_argument("--concurrency", type=int, default=1, help="число потоков-клиентов")
+    parser.add_argument(
+        "--data-file",
+        type=Path,
+        default=None,
+        help="файл хранилища, перезаписывается снимком из трассы (по умолчанию — новый временный)",
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        with TemporaryDirectory() as tmp_dir:
+            data_file = args.data_file or Path(tmp_dir) / "tasks.json"
+            report = replay_trace(
+                args.trace,
+                JsonTaskStorage(data_file),
+                speedup=args.speedup,
+                concurrency=args.concurrency,
+            )
+    except (OSError, ValueError, StorageError) as e:
+        print(f"❌ {e}")
+        return 1
+
+    print(report.format())
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())